@@ -13,7 +13,6 @@ from .settings import PygameKeyboardSettings, get_ui_settings
 SCREEN_SIZE = (1000, 500)
 
 pygame.init()
-pygame.key.set_repeat(500)
 screen = pygame.display.set_mode(SCREEN_SIZE)
 
 character = Character(Point(300, 300))
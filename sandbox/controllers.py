@@ -10,6 +10,8 @@ class Control:
     """Представляет один элемент управления на каком либо устройстве ввода.
     Это может быть клавиатура, геймпад, джойстик и т.д.
     """
+    __slots__ = ('_key_number', '_activated', '_value')
+
     def __init__(self, key_number: int):
         self._key_number = key_number
         self._activated = False
@@ -48,7 +50,14 @@ class Control:
 
 
 class Controller(ABC):
-    """Представляет физическое устройство ввода команд."""
+    """Представляет физическое устройство ввода команд.
+    Контролы создаются вместе с контроллером и не заменяются,
+    поэтому ссылки на них можно кэшировать.
+    """
+    __slots__ = (
+        '_move_up', '_move_right', '_move_down', '_move_left', '_accept', '_quit'
+    )
+
     def __init__(self):
         self._move_up = Control(0)
         self._move_right = Control(0)
@@ -61,34 +70,18 @@ class Controller(ABC):
     def move_right(self):
         return self._move_right
 
-    @move_right.setter
-    def move_right(self, value: Control):
-        self._move_right = value
-
     @property
     def move_left(self):
         return self._move_left
 
-    @move_left.setter
-    def move_left(self, value: Control):
-        self._move_left = value
-
     @property
     def move_up(self):
         return self._move_up
 
-    @move_up.setter
-    def move_up(self, value: Control):
-        self._move_up = value
-
     @property
     def move_down(self):
         return self._move_down
 
-    @move_down.setter
-    def move_down(self, value: Control):
-        self._move_down = value
-
     @property
     def accept(self):
         return self._accept
@@ -107,15 +100,31 @@ class Controller(ABC):
         ...
 
     def deactivate_all_controls(self):
-        self._move_right.deactivate()
-        self._move_left.deactivate()
-        self._move_up.deactivate()
-        self._move_down.deactivate()
-        self._accept.deactivate()
-        self._quit.deactivate()
+        # Вызывается каждый кадр, поэтому тело Control.deactivate встроено.
+        self._move_right._activated = False
+        self._move_right._value = 0
+        self._move_left._activated = False
+        self._move_left._value = 0
+        self._move_up._activated = False
+        self._move_up._value = 0
+        self._move_down._activated = False
+        self._move_down._value = 0
+        self._accept._activated = False
+        self._accept._value = 0
+        self._quit._activated = False
+        self._quit._value = 0
+
+    def reset(self) -> None:
+        """Сбрасывает накопленное состояние контроллера.
+        Нужно вызывать когда контроллер начинает опрашиваться заново,
+        например при открытии окна.
+        """
+        self.deactivate_all_controls()
 
 
 class PygameKeyboard(Controller):
+    __slots__ = ('_settings', '_pressed_keys', '_controls')
+
     def __init__(self, settings: ControllerSettings):
         self._settings = settings
         self._move_right = Control(settings.right.value)
@@ -124,27 +133,64 @@ class PygameKeyboard(Controller):
         self._move_down = Control(settings.down.value)
         self._accept = Control(pygame.K_RETURN)
         self._quit = Control(pygame.K_ESCAPE)
+        # Контролы контроллера не заменяются (сеттеров у Controller нет),
+        # а номера клавиш могут переназначаться в настройках,
+        # поэтому кэшируются сами контролы, а не номера клавиш.
+        self._controls = (
+            self._move_right,
+            self._move_left,
+            self._move_up,
+            self._move_down,
+            self._accept,
+            self._quit,
+        )
+        # Состояние клавиш собирается из событий,
+        # а pygame.key.get_pressed() читается только при сбросе и возврате фокуса.
+        self._pressed_keys: set[int] = set()
 
-    def conduct_survey_of_controls(self, events) -> None:
+    def reset(self) -> None:
+        """Сбрасывает контролы и заново считывает удерживаемые клавиши,
+        потому что для клавиш, нажатых до сброса, KEYDOWN уже не придёт.
+        """
+        super().reset()
+        self._read_held_keys()
+
+    def _read_held_keys(self) -> None:
         keys = pygame.key.get_pressed()
-        if keys[self._move_right.key_number]:
-            self._move_right.activate()
-        if keys[self._move_left.key_number]:
-            self._move_left.activate()
-        if keys[self._move_up.key_number]:
-            self._move_up.activate()
-        if keys[self._move_down.key_number]:
-            self._move_down.activate()
-        if keys[self._accept.key_number]:
-            self._accept.activate()
-        if keys[self._quit.key_number]:
-            self._quit.activate()
+        self._pressed_keys.clear()
+        self._pressed_keys.update(
+            control._key_number
+            for control in self._controls
+            if keys[control._key_number]
+        )
+
+    def conduct_survey_of_controls(self, events) -> None:
+        pressed_keys = self._pressed_keys
+        for event in events:
+            if event.type == pygame.KEYDOWN:
+                pressed_keys.add(event.key)
+            elif event.type == pygame.KEYUP:
+                pressed_keys.discard(event.key)
+            elif event.type == pygame.WINDOWFOCUSLOST:
+                # Отпускание клавиш вне окна до нас не дойдёт.
+                pressed_keys.clear()
+            elif event.type == pygame.WINDOWFOCUSGAINED:
+                # Клавиши могли нажать до возврата фокуса.
+                self._read_held_keys()
+
+        for control in self._controls:
+            if control._key_number in pressed_keys:
+                # Встроенное тело Control.activate.
+                control._activated = True
+                control._value = 1
 
     def __str__(self):
         return "Keyboard"
 
 
 class PygameIntermittentKeyboard(PygameKeyboard):
+    __slots__ = ()
+
     def __init__(self, settings: ControllerSettings):
         super().__init__(settings)
 
@@ -191,20 +237,29 @@ class GamePadButton(Enum):
     RS = 9
 
 
+# Номера осей в виде int, чтобы не обращаться к Enum при каждом опросе геймпада.
+LEFT_STICK_X = GamePadAxe.LEFT_STICK_X.value
+LEFT_STICK_Y = GamePadAxe.LEFT_STICK_Y.value
+
+
 class PygameGamepad(Controller):
-    def __init__(self):
-        # Конструктор должен принимать геймпад, потому что играть можно на нескольких
-        # геймпадах одновременно.
-        self._game_pad = [
-            pygame.joystick.Joystick(x)
-            for x
-            in range(pygame.joystick.get_count())
-        ][0]
+    __slots__ = ('_game_pad', '_get_axis', '_get_button', '_dead_zone')
+
+    def __init__(self, game_pad_index: int = 0):
+        # Номер геймпада передаётся снаружи,
+        # потому что играть можно на нескольких геймпадах одновременно.
+        if game_pad_index >= pygame.joystick.get_count():
+            raise RuntimeError(f"Gamepad {game_pad_index} is not connected")
+        # Открывается только нужный геймпад, а не все подключённые.
+        self._game_pad = pygame.joystick.Joystick(game_pad_index)
+        self._game_pad.init()
+        self._get_axis = self._game_pad.get_axis
+        self._get_button = self._game_pad.get_button
         self._dead_zone = 0.05
-        self._move_up = Control(GamePadAxe.LEFT_STICK_Y.value)
-        self._move_right = Control(GamePadAxe.LEFT_STICK_X.value)
-        self._move_down = Control(GamePadAxe.LEFT_STICK_Y.value)
-        self._move_left = Control(GamePadAxe.LEFT_STICK_X.value)
+        self._move_up = Control(LEFT_STICK_Y)
+        self._move_right = Control(LEFT_STICK_X)
+        self._move_down = Control(LEFT_STICK_Y)
+        self._move_left = Control(LEFT_STICK_X)
         self._accept = Control(GamePadButton.A.value)
         self._quit = Control(GamePadButton.B.value)
 
@@ -224,12 +279,12 @@ class PygameGamepad(Controller):
 
     def conduct_survey_of_controls(self, events) -> None:
         self._try_to_activate_stick_directions(
-            axe=GamePadAxe.LEFT_STICK_X,
+            axe=LEFT_STICK_X,
             positive_direction=self._move_right,
             negative_direction=self._move_left
         )
         self._try_to_activate_stick_directions(
-            axe=GamePadAxe.LEFT_STICK_Y,
+            axe=LEFT_STICK_Y,
             positive_direction=self._move_down,
             negative_direction=self._move_up
         )
@@ -238,7 +293,7 @@ class PygameGamepad(Controller):
 
     def _try_to_activate_stick_directions(
         self,
-        axe: GamePadAxe,
+        axe: int,
         positive_direction: Control,
         negative_direction: Control
     ) -> None:
@@ -246,26 +301,23 @@ class PygameGamepad(Controller):
         если стик физического устройства был активирован.
 
         Args:
-            axe: Одна из осей стика.
+            axe: Номер одной из осей стика.
             positive_direction: Элемент управления контроллера,
             отвечающий за позитивное направление выбранной оси.
             negative_direction: Элемент управления контроллера,
             отвечающий за отрицательное направление выбранной оси.
         """
-        value = self._game_pad.get_axis(axe.value)
-        if not value:
-            return
-
-        if abs(value) <= self._dead_zone:
-            return
-
-        if value > 0:
+        value = self._get_axis(axe)
+        dead_zone = self._dead_zone
+        # Знак значения проверяется вместе с мёртвой зоной,
+        # поэтому отдельные проверки на ноль и abs не нужны.
+        if value > dead_zone:
             positive_direction.activate(value)
-        else:
+        elif value < -dead_zone:
             negative_direction.activate(value)
 
     def _try_to_activate_button(self, button: Control) -> None:
-        if self._game_pad.get_button(button.key_number):
+        if self._get_button(button.key_number):
             button.activate()
 
     def __str__(self):
@@ -273,8 +325,10 @@ class PygameGamepad(Controller):
 
 
 class PygameIntermittentGamepad(PygameGamepad):
-    def __init__(self):
-        super().__init__()
+    __slots__ = ('_max_intermittent_frames', '_current_frame')
+
+    def __init__(self, game_pad_index: int = 0):
+        super().__init__(game_pad_index)
         self._max_intermittent_frames = 30
         self._current_frame = 0
 
@@ -290,7 +344,7 @@ class PygameIntermittentGamepad(PygameGamepad):
         self,
         positive_direction: Control,
         negative_direction: Control,
-        axe: GamePadAxe
+        axe: int
     ) -> None:
         """Стик должен активироваться единожды, даже если на физическом устройстве его
         продолжают нажимать.
@@ -298,7 +352,7 @@ class PygameIntermittentGamepad(PygameGamepad):
         Если на физическом устройстве его деактивировали, то счётчик кадров должен
         сбросится и следующая активация физ устройства должна активировать стик.
         """
-        value = self._game_pad.get_axis(axe.value)
+        value = self._get_axis(axe)
 
         if self._current_frame > 0:
             positive_direction.deactivate()
@@ -1,30 +1,47 @@
-from .model import Character, Point
+from .model import Character
 from .controllers import Controller
 
 
+# Направление движения по осям для каждой комбинации активированных контролов.
+# Индекс: бит 0 - вправо, бит 1 - влево, бит 2 - вверх, бит 3 - вниз.
+# При одновременной активации противоположных направлений
+# приоритет у направлений "вправо" и "вверх".
+_DIRECTIONS: tuple[tuple[int, int], ...] = tuple(
+    (
+        1 if index & 0b0001 else -1 if index & 0b0010 else 0,
+        -1 if index & 0b0100 else 1 if index & 0b1000 else 0,
+    )
+    for index in range(16)
+)
+
+
 class Mover:
     def __init__(self, controller: Controller):
         self._controller = controller
+        self._right = controller.move_right
+        self._left = controller.move_left
+        self._up = controller.move_up
+        self._down = controller.move_down
 
     def move_character(self, character: Character):
         speed = 0
+        right = self._right
+        left = self._left
+        up = self._up
+        down = self._down
+
+        # Метод вызывается каждый кадр,
+        # поэтому состояние контролов читается напрямую, минуя свойства.
+        dx, dy = _DIRECTIONS[
+            right._activated
+            | left._activated << 1
+            | up._activated << 2
+            | down._activated << 3
+        ]
+        # Значение деактивированного контрола равно нулю,
+        # поэтому max выбирает величину нажатия активного контрола.
+        location = character.location
         character.move_to(
-            Point(
-                x=self._get_new_x(character.location.x, speed),
-                y=self._get_new_y(character.location.y, speed)
-            )
+            location.x + dx * (max(abs(right._value), abs(left._value)) + speed),
+            location.y + dy * (max(abs(up._value), abs(down._value)) + speed)
         )
-
-    def _get_new_x(self, start_x: float, speed: float) -> float:
-        if self._controller.move_right.activated:
-            return start_x + self._controller.move_right.value + speed
-        if self._controller.move_left.activated:
-            return start_x - abs(self._controller.move_left.value) - speed
-        return start_x
-
-    def _get_new_y(self, start_y: float, speed: float) -> float:
-        if self._controller.move_up.activated:
-            return start_y - abs(self._controller.move_up.value) - speed
-        if self._controller.move_down.activated:
-            return start_y + self._controller.move_down.value + speed
-        return start_y
@@ -1,10 +1,18 @@
 class Point:
+    __slots__ = ('x', 'y')
+
     def __init__(self, x: float = 0, y: float = 0):
         self.x = x
         self.y = y
 
+    def set(self, x: float, y: float) -> None:
+        self.x = x
+        self.y = y
+
 
 class Character:
+    __slots__ = ('_location',)
+
     def __init__(self, start_point: Point):
         self._location = start_point
 
@@ -12,5 +20,6 @@ class Character:
     def location(self) -> Point:
         return self._location
 
-    def move_to(self, point: Point) -> None:
-        self._location = point
+    def move_to(self, x: float, y: float) -> None:
+        # Точка меняется на месте, чтобы не создавать новую на каждом кадре.
+        self._location.set(x, y)
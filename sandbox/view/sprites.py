@@ -5,16 +5,42 @@ from sandbox.model import Character
 
 
 class Sprite:
+    # Все персонажи выглядят одинаково, поэтому поверхность одна на всех.
+    _shared_surface: pygame.Surface | None = None
+
+    _size = (100, 100)
+
     def __init__(self, model: Character):
-        self.surface = pygame.Surface((100, 100))
-        self.surface.fill((250, 50, 50))
-        self.rect = self.surface.get_rect()
+        self.surface: pygame.Surface | None = None
+        self.rect = pygame.Rect((0, 0), self._size)
         self.rect.center = (300, 300)
+        self.blit_item: tuple[pygame.Surface, pygame.Rect] | None = None
         self._character = model
 
+    def prepare(self) -> None:
+        """Подготавливает поверхность спрайта к отрисовке.
+        Конвертация в формат экрана возможна только после создания окна,
+        поэтому метод вызывает окно, в котором спрайт будет отрисован.
+        """
+        self.surface = self._get_shared_surface()
+        # rect меняется на месте, поэтому кортеж можно собрать один раз
+        # и передавать в Surface.blits каждый кадр.
+        self.blit_item = (self.surface, self.rect)
+
+    @classmethod
+    def _get_shared_surface(cls) -> pygame.Surface:
+        if cls._shared_surface is None:
+            surface = pygame.Surface(cls._size)
+            surface.fill((250, 50, 50))
+            # Поверхность в формате экрана блитится без конвертации пикселей.
+            cls._shared_surface = surface.convert()
+        return cls._shared_surface
+
     def update(self):
         self.rect.x = self._character.location.x  # type: ignore
         self.rect.y = self._character.location.y  # type: ignore
 
     def draw(self, screen):
-        screen.blit(self.surface, self.rect)
+        if self.blit_item is None:
+            raise RuntimeError("Sprite.prepare() must be called before drawing")
+        screen.blit(*self.blit_item)
@@ -1,4 +1,6 @@
 from abc import ABC, abstractmethod
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from typing import Callable
 
 import pygame
 
@@ -18,6 +20,20 @@ class Window(ABC):
         self._is_showing = True
         self._screen = pygame.display.set_mode(size)
         self._size = size
+        # Поток для задач, которые не должны останавливать цикл окна.
+        # Создаётся при отправке первой задачи
+        # и останавливается в _finish_background_tasks.
+        self._executor: ThreadPoolExecutor | None = None
+        self._background_tasks: list[Future] = []
+        # Повтор KEYDOWN при удержании клавиши (задержка, интервал в мс).
+        # (0, 0) - повтор выключен.
+        self._key_repeat: tuple[int, int] = (0, 0)
+        self._previous_key_repeat: tuple[int, int] = (0, 0)
+        # Окна без постоянной анимации перерисовываются только после изменений,
+        # но не чаще чем _max_redraw_fps раз в секунду.
+        self._max_redraw_fps = 30
+        self._needs_redraw = True
+        self._last_redraw_time = 0
         pygame.display.set_caption(caption)
 
     @abstractmethod
@@ -27,6 +43,104 @@ class Window(ABC):
     def quit(self):
         self._is_showing = False
 
+    def _setup_key_repeat(self) -> None:
+        """Включает повтор клавиш нужный окну.
+        Окна открываются друг из друга, поэтому прежнее значение запоминается
+        и восстанавливается методом _restore_key_repeat при закрытии окна.
+        """
+        self._previous_key_repeat = pygame.key.get_repeat()
+        pygame.key.set_repeat(*self._key_repeat)
+
+    def _restore_key_repeat(self) -> None:
+        pygame.key.set_repeat(*self._previous_key_repeat)
+
+    def _run_in_background(self, task: Callable[[], None]) -> None:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=1)
+        self._background_tasks.append(self._executor.submit(task))
+
+    def _collect_background_tasks(self) -> None:
+        """Убирает завершённые фоновые задачи.
+        Нужно вызывать каждый кадр, чтобы исключения из задач не терялись.
+        """
+        for task in [task for task in self._background_tasks if task.done()]:
+            self._background_tasks.remove(task)
+            task.result()
+
+    def _finish_background_tasks(self) -> None:
+        """Дожидается оставшихся фоновых задач и останавливает их поток.
+        Нужно вызывать при закрытии окна, чтобы исключения из задач не терялись.
+        """
+        tasks, self._background_tasks = self._background_tasks, []
+        wait(tasks)
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+        for task in tasks:
+            task.result()
+
+    def _wait_for_events(self, timeout: int | None) -> list[pygame.event.Event]:
+        """Усыпляет процесс до появления события или до истечения timeout.
+        Подходит для окон без постоянной анимации.
+
+        Args:
+            timeout: Максимальное время ожидания события в миллисекундах.
+            None - ждать события без ограничения по времени.
+        """
+        if timeout is None:
+            event = pygame.event.wait()
+        else:
+            event = pygame.event.wait(timeout)
+        if event.type == pygame.NOEVENT:
+            return []
+        # Ждать с таймаутом нужно только первое событие.
+        # Остальные уже в очереди и забираются без блокировки.
+        return [event, *pygame.event.get()]
+
+    @staticmethod
+    def _window_was_exposed(events: list[pygame.event.Event]) -> bool:
+        """Проверяет, просила ли система перерисовать содержимое окна,
+        например после того как окно было перекрыто или свёрнуто.
+        """
+        for event in events:
+            if event.type in (pygame.WINDOWEXPOSED, pygame.VIDEOEXPOSE):
+                return True
+        return False
+
+    def _get_redraw_timeout(self, needs_redraw: bool) -> int | None:
+        """Возвращает время ожидания событий для окна без постоянной анимации.
+        Просыпаться без событий нужно только ради отложенной перерисовки,
+        иначе окно спит до первого события.
+        """
+        if not needs_redraw:
+            return None
+        elapsed = pygame.time.get_ticks() - self._last_redraw_time
+        # pygame.event.wait(0) ждёт бесконечно, поэтому минимум 1 мс.
+        return max(1000 // self._max_redraw_fps - elapsed, 1)
+
+    def _redraw_interval_passed(self) -> bool:
+        now = pygame.time.get_ticks()
+        if now - self._last_redraw_time < 1000 // self._max_redraw_fps:
+            return False
+        self._last_redraw_time = now
+        return True
+
+    def _redraw_if_needed(self, events: list[pygame.event.Event]) -> None:
+        """Перерисовывает окно, если его состояние изменилось
+        или система попросила обновить содержимое окна.
+        Отложенная перерисовка выполнится на одной из следующих итераций.
+        """
+        if self._window_was_exposed(events):
+            self._needs_redraw = True
+        if not self._needs_redraw or not self._redraw_interval_passed():
+            return
+        self._draw_all_components()
+        self._needs_redraw = False
+
+    @abstractmethod
+    def _draw_all_components(self):
+        ...
+
     def _events_handler(self):
         self._quit_if_user_wants_to_close_window()
 
@@ -45,23 +159,31 @@ class SettingsWindow(Window):
             controller: Controller):
         super().__init__(caption, size, controller)
         self._background_color = (0, 49, 83)
+        # Навигация по настройкам срабатывает по KEYDOWN,
+        # поэтому при удержании клавиши нужен повтор.
+        self._key_repeat = (400, 60)
         self._settings = settings
         self._initialize_components()
 
     def show(self):
-        fps = 30
-        clock = pygame.time.Clock()
+        self._setup_key_repeat()
+        self._needs_redraw = True
+        self._redraw_if_needed([])
 
         while self._is_showing:
-            events = pygame.event.get()
+            events = self._wait_for_events(
+                self._get_redraw_timeout(self._needs_redraw)
+            )
             self._controller.conduct_survey_of_controls(events)
             self._events_handler()
+            self._collect_background_tasks()
 
-            self._draw_all_components()
+            self._redraw_if_needed(events)
 
             self._controller.deactivate_all_controls()
-            clock.tick(fps)
 
+        self._finish_background_tasks()
+        self._restore_key_repeat()
         self._is_showing = True
 
     def _initialize_components(self):
@@ -137,6 +259,7 @@ class SettingsWindow(Window):
         else:
             return
 
+        self._needs_redraw = True
         for i, setting in enumerate(self._controls):
             if not isinstance(setting, RowSetting):
                 continue
@@ -155,6 +278,8 @@ class SettingsWindow(Window):
             key_control.activate()
 
             key_number = self._waiting_for_user_assign_new_key(key_control)
+            # Рамку вокруг клавиши нужно стереть в любом случае.
+            self._needs_redraw = True
             if key_number is None:
                 return
 
@@ -165,7 +290,7 @@ class SettingsWindow(Window):
             key_control._control.update_key_number(key_number)
 
             key_control._setting.value = key_number
-            self._settings.save()
+            self._run_in_background(self._settings.save)
 
             key_control.deactivate()
 
@@ -173,11 +298,16 @@ class SettingsWindow(Window):
         # TODO: Тут дохера логики,
         # и ивенты, и черчение рамки и апдейт экрана.
         # Надо подумать как это сделать лаконичней.
+        key_control.draw_frame(self._screen)
+        pygame.display.update()
+        needs_redraw = False
+
         while True:
             # TODO: Использовать контроллер.
             # Но чтобы это сделать,
             # нужно чтобы контроллер смог отдать любую нажатую клавишу.
-            for event in pygame.event.get():
+            events = self._wait_for_events(self._get_redraw_timeout(needs_redraw))
+            for event in events:
                 if event.type != pygame.KEYDOWN:
                     continue
                 if event.key == pygame.K_ESCAPE:
@@ -185,8 +315,14 @@ class SettingsWindow(Window):
                 # TODO: Добавить список возможных клавиш для назначения
                 else:
                     return event.key
-            key_control.draw_frame(self._screen)
-            pygame.display.update()
+            # Рамка не меняется, поэтому окно перерисовывается целиком
+            # только когда система просит обновить его содержимое.
+            needs_redraw = needs_redraw or self._window_was_exposed(events)
+            if needs_redraw and self._redraw_interval_passed():
+                self._draw_all_components()
+                key_control.draw_frame(self._screen)
+                pygame.display.update()
+                needs_redraw = False
 
 
 class GameWindow(Window):
@@ -200,20 +336,50 @@ class GameWindow(Window):
         super().__init__(caption, size, controller)
         self._background_color = (30, 89, 89)
         self._sprite = sprite
+        self._sprite.prepare()
+        self._blit_sequence = [sprite.blit_item]
         self._mover = mover
+        # Если грязная область больше четверти экрана,
+        # то дешевле перерисовать экран целиком.
+        self._max_dirty_area = size[0] * size[1] // 4
+        self._previous_sprite_rect: pygame.Rect | None = None
 
     def show(self):
+        # Экран мог быть перерисован другим окном,
+        # поэтому первый кадр всегда рисуется целиком.
+        self._previous_sprite_rect = None
+        controller = self._mover._controller
+        # Клавиши, отпущенные пока окно было закрыто, иначе считались бы нажатыми.
+        controller.reset()
+        # Движение опрашивает удерживаемые клавиши,
+        # а повтор только забивал бы очередь лишними KEYDOWN.
+        self._setup_key_repeat()
+        fps = 60
+        clock = pygame.time.Clock()
+
+        # Функции цикла связываются заранее,
+        # чтобы не искать их в модулях и объектах на каждом кадре.
+        get_events = pygame.event.get
+        conduct_survey_of_controls = controller.conduct_survey_of_controls
+        deactivate_all_controls = controller.deactivate_all_controls
+        tick = clock.tick
+
         while self._is_showing:
-            events = pygame.event.get()
-            self._mover._controller.conduct_survey_of_controls(events)
+            events = get_events()
+            if self._window_was_exposed(events):
+                # Содержимое окна вне спрайта потеряно, рисуем экран целиком.
+                self._previous_sprite_rect = None
+            conduct_survey_of_controls(events)
             self._events_handler()
 
             self._move_all_objects()
             self._update_all_objects()
             self._draw_all_components()
 
-            self._mover._controller.deactivate_all_controls()
+            deactivate_all_controls()
+            tick(fps)
 
+        self._restore_key_repeat()
         self._is_showing = True
 
     def _move_all_objects(self):
@@ -224,33 +390,57 @@ class GameWindow(Window):
         self._sprite.update()
 
     def _draw_all_components(self):
+        previous_rect = self._previous_sprite_rect
+        current_rect = self._sprite.rect
+        if previous_rect is None:
+            self._draw_whole_screen()
+        else:
+            dirty_rect = previous_rect.union(current_rect)
+            if dirty_rect.width * dirty_rect.height > self._max_dirty_area:
+                self._draw_whole_screen()
+            else:
+                self._screen.fill(self._background_color, dirty_rect)
+                self._draw_sprites()
+                pygame.display.update(dirty_rect)
+        self._previous_sprite_rect = current_rect.copy()
+
+    def _draw_whole_screen(self):
         self._screen.fill(self._background_color)
-        self._sprite.draw(self._screen)
-        pygame.display.update()
+        self._draw_sprites()
+        pygame.display.flip()
+
+    def _draw_sprites(self):
+        self._screen.blits(self._blit_sequence, doreturn=False)
 
 
 class MenuWindow(Window):
     def __init__(self, caption, size, controller: Controller):
         super().__init__(caption, size, controller)
         self._background_color = (156, 156, 156)
+        # Навигация по меню срабатывает по KEYDOWN,
+        # поэтому при удержании клавиши нужен повтор.
+        self._key_repeat = (400, 60)
         self.play_button_handlers = []
         self.settings_button_handlers = []
         self._initialize_components()
 
     def show(self):
-        fps = 30
-        clock = pygame.time.Clock()
+        self._setup_key_repeat()
+        self._needs_redraw = True
+        self._redraw_if_needed([])
 
         while self._is_showing:
-            events = pygame.event.get()
+            events = self._wait_for_events(
+                self._get_redraw_timeout(self._needs_redraw)
+            )
             self._controller.conduct_survey_of_controls(events)
             self._events_handler()
 
-            self._draw_all_components()
+            self._redraw_if_needed(events)
 
             self._controller.deactivate_all_controls()
-            clock.tick(fps)
 
+        self._restore_key_repeat()
         self._is_showing = True
 
     def _initialize_components(self):
@@ -316,6 +506,7 @@ class MenuWindow(Window):
         else:
             return
 
+        self._needs_redraw = True
         for i, control in enumerate(self._controls):
             if not isinstance(control, Button):
                 continue
@@ -334,11 +525,15 @@ class MenuWindow(Window):
         self._controller.deactivate_all_controls()
         for handler in self.play_button_handlers:
             handler()
+        # Дочернее окно рисовало на том же экране.
+        self._needs_redraw = True
 
     def _on_settings_button_click(self):
         self._controller.deactivate_all_controls()
         for handler in self.settings_button_handlers:
             handler()
+        # Дочернее окно рисовало на том же экране.
+        self._needs_redraw = True
 
     def _on_quit_button_click_handler(self):
         self.quit()
@@ -11,16 +11,24 @@ pygame.init()
 
 
 class Text:
+    _max_cache_size = 256
+
     def __init__(self, screen, font, color: tuple[int, int, int]):
         self._screen = screen
         self._font = font
         self._color = color
+        # Надписи почти не меняются от кадра к кадру,
+        # поэтому отрисованный текст переиспользуется.
+        self._cache: dict[str, pygame.Surface] = {}
 
     def render(self, value: str, location: tuple[int, int]):
-        self._screen.blit(
-            self._font.render(value, False, self._color),
-            location
-        )
+        surface = self._cache.get(value)
+        if surface is None:
+            if len(self._cache) >= self._max_cache_size:
+                self._cache.clear()
+            surface = self._font.render(value, False, self._color)
+            self._cache[value] = surface
+        self._screen.blit(surface, location)
 
 
 class Test:
@@ -62,6 +70,7 @@ class Test:
             if self._controller_index == len(self._controllers):
                 self._controller_index = 0
             self._controller = self._controllers[self._controller_index]
+            self._controller.reset()
 
     def _start_loop(self, screen, color):
         close_window = False
@@ -72,8 +81,12 @@ class Test:
         black_color = (0, 0, 0)
         text = Text(screen, font, black_color)
 
+        get_events = pygame.event.get
+        update_display = pygame.display.update
+        tick = clock.tick
+
         while not close_window:
-            events = pygame.event.get()
+            events = get_events()
             self._controller.conduct_survey_of_controls(events)
             if self._controller.quit.activated:
                 return
@@ -82,10 +95,10 @@ class Test:
             screen.fill(color)
             self._render_labels(text)
 
-            pygame.display.update()
+            update_display()
 
             self._controller.deactivate_all_controls()
-            clock.tick(fps)
+            tick(fps)
 
     def start(self):
         SCREEN_SIZE = (1000, 500)
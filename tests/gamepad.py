@@ -130,11 +130,10 @@ if __name__ == '__main__':
     pygame.joystick.init()
     screen = pygame.display.set_mode(SCREEN_SIZE)
 
-    gamepad = [
-        pygame.joystick.Joystick(x)
-        for x
-        in range(pygame.joystick.get_count())
-    ][0]
+    if pygame.joystick.get_count() == 0:
+        raise RuntimeError("Gamepad is not connected")
+    gamepad = pygame.joystick.Joystick(0)
+    gamepad.init()
 
     t = Test(screen, gamepad)
     t.start()